@@ -5,22 +5,214 @@ Fetches TVL, APY, and rewards data for Balancer pools with Aura Finance integrat
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
 import json
 import time
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from tabulate import tabulate
 import argparse
 import sys
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 
-from data_store import PoolDataStore, PoolData
+from data_store import PoolDataStore, PoolData, format_currency, json_dumps, json_loads, utc_now_iso
 
 # Load environment variables
 load_dotenv()
 
 
+def _invert_mapping(mapping: Dict[str, str]) -> Dict[str, List[str]]:
+    """Invert a key -> value mapping into value -> [keys]"""
+    inverted = defaultdict(list)
+    for key, value in mapping.items():
+        inverted[value].append(key)
+    return dict(inverted)
+
+
+# Pool selection shared by the full-detail Balancer queries
+POOL_FIELDS = """
+    id
+    address
+    name
+    symbol
+    type
+    version
+    dynamicData {
+        totalLiquidity
+        totalShares
+        fees24h
+        volume24h
+        aprItems {
+            title
+            type
+            apr
+            rewardTokenSymbol
+        }
+    }
+    poolTokens {
+        address
+        symbol
+        decimals
+        balance
+        weight
+        priceRate
+    }
+"""
+
+# poolGetPool returns GqlPoolBase; poolGetPools returns GqlPoolMinimal, which a
+# GqlPoolBase fragment can't be spread into, so that query inlines POOL_FIELDS
+POOL_FIELDS_FRAGMENT = f"fragment PoolFields on GqlPoolBase {{{POOL_FIELDS}}}"
+
+GET_POOL_QUERY = f"""
+{POOL_FIELDS_FRAGMENT}
+query GetPool($poolId: String!, $chain: GqlChain!) {{
+    poolGetPool(id: $poolId, chain: $chain) {{
+        ...PoolFields
+    }}
+}}
+"""
+
+GET_POOLS_BY_ADDRESS_QUERY = f"""
+query GetPools($chain: [GqlChain!], $addresses: [String!]) {{
+    poolGetPools(
+        where: {{chainIn: $chain, addressIn: $addresses}}
+    ) {{{POOL_FIELDS}}}
+}}
+"""
+
+GET_TOP_POOLS_QUERY = """
+query GetTopPools($chain: [GqlChain!], $minTvl: Float, $first: Int) {
+    poolGetPools(
+        where: {chainIn: $chain, minTvl: $minTvl}
+        first: $first
+        orderBy: totalLiquidity
+        orderDirection: desc
+    ) {
+        id
+        address
+        name
+        symbol
+        type
+        dynamicData {
+            totalLiquidity
+            aprItems {
+                title
+                type
+                apr
+            }
+        }
+        poolTokens {
+            symbol
+            balance
+            weight
+        }
+    }
+}
+"""
+
+AURA_POOLS_QUERY = """
+{
+    pools(first: 500) {
+        id
+        lpToken { id symbol }
+        totalStaked
+        rewardPool
+        rewardData {
+            token { symbol decimals }
+            rewardRate
+            periodFinish
+        }
+    }
+}
+"""
+
+
+def create_session() -> requests.Session:
+    """Create an HTTP session with the tracker's default headers, pooling and retries"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'BalancerTracker/1.0',
+        'Content-Type': 'application/json'
+    })
+
+    # Size the pool for concurrent fetches and let urllib3 handle rate limits
+    # and transient errors. GraphQL POSTs are read-only, so retrying them is safe.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+
+class ResponseCache:
+    """
+    TTL cache for API responses, persisted as JSON files between runs.
+
+    Lets back-to-back runs (e.g. cron) skip slow-changing endpoints like
+    CoinGecko prices and the Aura subgraphs instead of re-fetching them.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files (default: ~/.cache/balancer_tracker)
+        """
+        if not cache_dir:
+            cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+            cache_dir = os.path.join(cache_home, 'balancer_tracker')
+        self.cache_dir = cache_dir
+
+    def _path(self, key) -> str:
+        """Map a JSON-serializable key to its cache file"""
+        raw = json.dumps(key, sort_keys=True).encode()
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key, ttl: float) -> Optional[Dict]:
+        """Return the cached value for key, or None if missing or older than ttl seconds"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, 'rb') as f:
+                return json_loads(f.read())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(self, key, value: Dict):
+        """Store value for key"""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(value))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to write cache entry: {e}")
+
+    def delete(self, key):
+        """Drop the cached value for key, if any"""
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
 class BalancerAPI:
     """Balancer GraphQL API client"""
 
@@ -42,17 +234,20 @@ class BalancerAPI:
         'sonic': 'SONIC',
     }
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BalancerTracker/1.0',
-            'Content-Type': 'application/json'
-        })
+    # Max concurrent requests when fetching many pools
+    MAX_WORKERS = 8
+    # Max addresses per addressIn query, keeps requests small enough to never hit server limits
+    ADDRESS_BATCH_SIZE = 25
+
+    def __init__(self, session: requests.Session = None):
+        self.session = session or create_session()
         self._pool_cache = {}  # Cache address -> pool ID mapping
 
-    def _gql_chain(self, chain: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _gql_chain(chain: str) -> str:
         """Convert chain name to GraphQL enum"""
-        return self.CHAIN_MAP.get(chain.lower(), 'MAINNET')
+        return BalancerAPI.CHAIN_MAP.get(chain.lower(), 'MAINNET')
 
     def _make_request(self, query: str, variables: Dict = None) -> Dict:
         """Make GraphQL request"""
@@ -61,121 +256,89 @@ class BalancerAPI:
             payload['variables'] = variables
 
         try:
-            response = self.session.post(self.BASE_URL, json=payload, timeout=30)
+            response = self.session.post(self.BASE_URL, data=json_dumps(payload), timeout=30)
             response.raise_for_status()
-            result = response.json()
+            result = json_loads(response.content)
 
             if 'errors' in result:
                 print(f"GraphQL errors: {result['errors']}")
                 return {}
 
             return result.get('data', {})
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Balancer API request failed: {e}")
             return {}
 
     def get_pool_by_id(self, pool_id: str, chain: str = 'ethereum') -> Optional[Dict]:
         """Get pool data by full pool ID"""
-        query = """
-        query GetPool($poolId: String!, $chain: GqlChain!) {
-            poolGetPool(id: $poolId, chain: $chain) {
-                id
-                address
-                name
-                symbol
-                type
-                version
-                dynamicData {
-                    totalLiquidity
-                    totalShares
-                    fees24h
-                    volume24h
-                    aprItems {
-                        title
-                        type
-                        apr
-                        rewardTokenSymbol
-                    }
-                }
-                poolTokens {
-                    address
-                    symbol
-                    decimals
-                    balance
-                    weight
-                    priceRate
-                }
-            }
-        }
-        """
-
         variables = {
             'poolId': pool_id,
             'chain': self._gql_chain(chain)
         }
 
-        result = self._make_request(query, variables)
+        result = self._make_request(GET_POOL_QUERY, variables)
         return result.get('poolGetPool')
 
-    def get_pools_by_address(self, addresses: List[str], chain: str = 'ethereum') -> List[Dict]:
-        """Get pools by addresses (batch query)"""
-        # First get pool list for chain to find matching addresses
-        gql_chain = self._gql_chain(chain)
-
-        query = """
-        query GetPools($chain: [GqlChain!], $minTvl: Float) {
-            poolGetPools(
-                where: {chainIn: $chain, minTvl: $minTvl}
-                first: 1000
-                orderBy: totalLiquidity
-                orderDirection: desc
-            ) {
-                id
-                address
-                name
-                symbol
-                type
-                version
-                dynamicData {
-                    totalLiquidity
-                    totalShares
-                    fees24h
-                    volume24h
-                    aprItems {
-                        title
-                        type
-                        apr
-                        rewardTokenSymbol
-                    }
-                }
-                poolTokens {
-                    address
-                    symbol
-                    decimals
-                    balance
-                    weight
-                    priceRate
-                }
-            }
-        }
+    def get_pools_by_ids(self, pool_refs: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+        """
+        Get several pools by full pool ID in a single request.
+
+        Each lookup is an aliased poolGetPool field (p0, p1, ...) in one GraphQL
+        document, so N pools cost one round-trip instead of N.
+
+        Args:
+            pool_refs: List of (pool_id, chain) tuples
+
+        Returns:
+            Pool data dicts (or None) in the same order as pool_refs
         """
+        if not pool_refs:
+            return []
+
+        params = ", ".join(f"$id{i}: String!, $chain{i}: GqlChain!" for i in range(len(pool_refs)))
+        fields = "\n    ".join(
+            f"p{i}: poolGetPool(id: $id{i}, chain: $chain{i}) {{ ...PoolFields }}"
+            for i in range(len(pool_refs))
+        )
+        query = f"""
+{POOL_FIELDS_FRAGMENT}
+query GetPoolsByIds({params}) {{
+    {fields}
+}}
+"""
+
+        variables = {}
+        for i, (pool_id, chain) in enumerate(pool_refs):
+            variables[f'id{i}'] = pool_id
+            variables[f'chain{i}'] = self._gql_chain(chain)
 
+        result = self._make_request(query, variables)
+        if not result:
+            # One bad ID fails the whole document - fall back to per-pool requests
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                return list(executor.map(lambda ref: self.get_pool_by_id(*ref), pool_refs))
+
+        return [result.get(f'p{i}') for i in range(len(pool_refs))]
+
+    def get_pools_by_address(self, addresses: List[str], chain: str = 'ethereum') -> List[Dict]:
+        """Get pools by addresses (batch query)"""
+        # Filter server-side so only the requested pools are returned
+        addresses_set = {a.lower() for a in addresses}
         variables = {
-            'chain': [gql_chain],
-            'minTvl': 0  # Get all pools
+            'chain': [self._gql_chain(chain)],
+            'addresses': sorted(addresses_set)
         }
 
-        result = self._make_request(query, variables)
-        all_pools = result.get('poolGetPools', [])
+        result = self._make_request(GET_POOLS_BY_ADDRESS_QUERY, variables)
 
-        # Filter by requested addresses
-        addresses_lower = [a.lower() for a in addresses]
+        # Guard against anything outside the requested set (O(1) membership per pool)
         matching = []
-        for pool in all_pools:
-            if pool.get('address', '').lower() in addresses_lower:
+        for pool in result.get('poolGetPools', []):
+            addr = pool.get('address', '').lower()
+            if addr in addresses_set:
                 matching.append(pool)
                 # Cache the mapping
-                self._pool_cache[pool['address'].lower()] = pool['id']
+                self._pool_cache[addr] = pool['id']
 
         return matching
 
@@ -190,10 +353,7 @@ class BalancerAPI:
         Returns:
             Pool data dict or None
         """
-        # Check if it looks like a full pool ID (64+ hex chars) or just an address (40 hex chars)
-        clean_id = identifier.lower().replace('0x', '')
-
-        if len(clean_id) > 42:
+        if self.is_pool_id(identifier):
             # Looks like a full pool ID
             return self.get_pool_by_id(identifier, chain)
         else:
@@ -201,45 +361,25 @@ class BalancerAPI:
             pools = self.get_pools_by_address([identifier], chain)
             return pools[0] if pools else None
 
-    def get_top_pools(self, chain: str = 'ethereum', limit: int = 10, min_tvl: float = 100000) -> List[Dict]:
-        """Get top pools by TVL"""
-        query = """
-        query GetTopPools($chain: [GqlChain!], $minTvl: Float, $first: Int) {
-            poolGetPools(
-                where: {chainIn: $chain, minTvl: $minTvl}
-                first: $first
-                orderBy: totalLiquidity
-                orderDirection: desc
-            ) {
-                id
-                address
-                name
-                symbol
-                type
-                dynamicData {
-                    totalLiquidity
-                    aprItems {
-                        title
-                        type
-                        apr
-                    }
-                }
-                poolTokens {
-                    symbol
-                    balance
-                    weight
-                }
-            }
-        }
+    @staticmethod
+    def is_pool_id(identifier: str) -> bool:
+        """
+        Check if identifier is a full pool ID rather than a pool address.
+
+        Full v2 pool IDs are 64 hex chars (66 with 0x), addresses are 40 (42 with 0x),
+        so the raw length alone tells them apart without building cleaned copies.
         """
+        return len(identifier) >= 64
 
+    def get_top_pools(self, chain: str = 'ethereum', limit: int = 10, min_tvl: float = 100000) -> List[Dict]:
+        """Get top pools by TVL"""
         variables = {
             'chain': [self._gql_chain(chain)],
             'minTvl': min_tvl,
             'first': limit
         }
 
-        result = self._make_request(query, variables)
+        result = self._make_request(GET_TOP_POOLS_QUERY, variables)
         return result.get('poolGetPools', [])
 
 
@@ -267,40 +407,71 @@ class AuraFinanceAPI:
         'axlOP': 'optimism',
     }
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BalancerTracker/1.0',
-            'Content-Type': 'application/json'
-        })
+    # Derived from COINGECKO_IDS once: coingecko_id -> [symbols], and the sorted
+    # ids query param (stable order keeps the URL - and its disk cache key - fixed)
+    _CG_ID_TO_SYMBOLS = _invert_mapping(COINGECKO_IDS)
+    _CG_IDS_PARAM = ','.join(sorted(_CG_ID_TO_SYMBOLS))
+
+    # Max concurrent subgraph requests when prefetching several chains
+    MAX_WORKERS = 8
+
+    # Disk cache lifetimes (seconds)
+    PRICE_CACHE_TTL = 60
+    SUBGRAPH_CACHE_TTL = 300
+
+    SECONDS_PER_YEAR = 365 * 86400
+
+    # 10 ** decimals as floats for the usual token decimals, so reward rates
+    # don't need an integer pow per reward token
+    _DECIMAL_DIVISORS = {d: float(10 ** d) for d in range(25)}
+
+    def __init__(self, session: requests.Session = None, cache: ResponseCache = None):
+        self.session = session or create_session()
+        self.cache = cache  # Optional disk cache shared across runs
         self._pools_cache = {}  # Cache: chain -> {lp_address -> pool_data}
         self._price_cache = {}  # Cache: token -> price
         self._prices_fetched = False  # Track if we've done batch fetch
+        self._price_version = 0  # Bumped whenever _price_cache is (re)loaded
+        self._apr_cache = {}  # Cache: (pool id, tvl, bal_max_apr, price version) -> APRs
+        self._lock = threading.Lock()  # Guards _pools_cache during prefetch
 
     def _make_request(self, url: str, query: str, variables: Dict = None) -> Dict:
         """Make GraphQL request to Aura subgraph"""
+        cache_key = ['aura', url, query, variables]
+        if self.cache:
+            cached = self.cache.get(cache_key, self.SUBGRAPH_CACHE_TTL)
+            if cached is not None:
+                return cached
+
         payload = {'query': query}
         if variables:
             payload['variables'] = variables
 
         try:
-            response = self.session.post(url, json=payload, timeout=30)
+            response = self.session.post(url, data=json_dumps(payload), timeout=30)
             response.raise_for_status()
-            result = response.json()
+            result = json_loads(response.content)
 
             if 'errors' in result:
                 print(f"Aura GraphQL errors: {result['errors']}")
+                if self.cache:
+                    self.cache.delete(cache_key)
                 return {}
 
-            return result.get('data', {})
-        except requests.exceptions.RequestException as e:
+            data = result.get('data', {})
+            if self.cache:
+                self.cache.set(cache_key, data)
+            return data
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Aura API request failed: {e}")
+            if self.cache:
+                self.cache.delete(cache_key)
             return {}
 
-    def fetch_all_prices(self, max_retries: int = 3) -> Dict[str, float]:
+    def fetch_all_prices(self) -> Dict[str, float]:
         """
         Batch fetch all known token prices from CoinGecko in a single request.
-        Uses retry logic with exponential backoff to handle rate limits.
+        Rate limits (429) are retried with backoff by the session's retry adapter.
 
         Returns:
             Dict mapping symbol -> price in USD
@@ -308,48 +479,34 @@ class AuraFinanceAPI:
         if self._prices_fetched:
             return self._price_cache
 
-        # Get unique CoinGecko IDs
-        unique_ids = set(self.COINGECKO_IDS.values())
-        ids_str = ','.join(unique_ids)
-
-        url = f"https://api.coingecko.com/api/v3/simple/price?ids={ids_str}&vs_currencies=usd"
-
-        # Reverse mapping: coingecko_id -> [symbols]
-        id_to_symbols = {}
-        for symbol, cg_id in self.COINGECKO_IDS.items():
-            if cg_id not in id_to_symbols:
-                id_to_symbols[cg_id] = []
-            id_to_symbols[cg_id].append(symbol)
-
-        for attempt in range(max_retries):
-            try:
-                response = self.session.get(url, timeout=15)
-                response.raise_for_status()
-                data = response.json()
-
-                # Map prices back to symbols
-                for cg_id, price_data in data.items():
-                    price = price_data.get('usd')
-                    if price and cg_id in id_to_symbols:
-                        for symbol in id_to_symbols[cg_id]:
-                            self._price_cache[symbol] = price
+        url = f"https://api.coingecko.com/api/v3/simple/price?ids={self._CG_IDS_PARAM}&vs_currencies=usd"
 
+        cache_key = ['coingecko', url]
+        if self.cache:
+            cached = self.cache.get(cache_key, self.PRICE_CACHE_TTL)
+            if cached is not None:
+                self._price_cache.update(cached)
+                self._price_version += 1
                 self._prices_fetched = True
                 return self._price_cache
 
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 429:
-                    # Rate limited - wait with exponential backoff
-                    import time
-                    wait_time = (2 ** attempt) * 2  # 2, 4, 8 seconds
-                    if attempt < max_retries - 1:
-                        time.sleep(wait_time)
-                        continue
-                print(f"CoinGecko batch price fetch failed: {e}")
-                break
-            except Exception as e:
-                print(f"CoinGecko batch price fetch failed: {e}")
-                break
+        try:
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            data = json_loads(response.content)
+
+            # Map prices back to symbols
+            for cg_id, price_data in data.items():
+                price = price_data.get('usd')
+                if price and cg_id in self._CG_ID_TO_SYMBOLS:
+                    for symbol in self._CG_ID_TO_SYMBOLS[cg_id]:
+                        self._price_cache[symbol] = price
+
+            self._price_version += 1
+            if self.cache and self._price_cache:
+                self.cache.set(cache_key, self._price_cache)
+        except Exception as e:
+            print(f"CoinGecko batch price fetch failed: {e}")
 
         self._prices_fetched = True  # Don't retry on subsequent calls
         return self._price_cache
@@ -375,6 +532,11 @@ class AuraFinanceAPI:
         Returns:
             Dict mapping lowercase LP address -> pool data
         """
+        # Config chains are normally lowercase already - skip .lower() on cache hits
+        cached = self._pools_cache.get(chain)
+        if cached is not None:
+            return cached
+
         chain_lower = chain.lower()
         if chain_lower in self._pools_cache:
             return self._pools_cache[chain_lower]
@@ -383,23 +545,7 @@ class AuraFinanceAPI:
         if not url:
             return {}
 
-        query = """
-        {
-            pools(first: 500) {
-                id
-                lpToken { id symbol }
-                totalStaked
-                rewardPool
-                rewardData {
-                    token { symbol decimals }
-                    rewardRate
-                    periodFinish
-                }
-            }
-        }
-        """
-
-        result = self._make_request(url, query)
+        result = self._make_request(url, AURA_POOLS_QUERY)
         pools = result.get('pools', [])
 
         # Index by LP token address
@@ -409,9 +555,33 @@ class AuraFinanceAPI:
             if lp_address:
                 indexed[lp_address] = pool
 
-        self._pools_cache[chain_lower] = indexed
+        with self._lock:
+            self._pools_cache[chain_lower] = indexed
         return indexed
 
+    def prefetch_pools(self, chains: List[str]) -> Dict[str, Dict[str, Dict]]:
+        """
+        Fetch Aura pools for several chains in parallel.
+
+        Each chain has its own subgraph endpoint, so the requests are independent
+        and total wall time is bounded by the slowest chain instead of the sum.
+
+        Args:
+            chains: Chain names to fetch
+
+        Returns:
+            Dict mapping lowercase chain -> {lp_address -> pool_data}
+        """
+        chains_lower = {chain.lower() for chain in chains}
+        with self._lock:
+            missing = [c for c in chains_lower if c not in self._pools_cache]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                list(executor.map(self.get_pools, missing))
+
+        return {chain: self._pools_cache.get(chain, {}) for chain in chains_lower}
+
     def find_pool_by_balancer_address(self, balancer_address: str, chain: str = 'ethereum') -> Optional[Dict]:
         """Find Aura pool by Balancer pool address"""
         pools = self.get_pools(chain)
@@ -432,7 +602,14 @@ class AuraFinanceAPI:
         if not aura_pool or tvl <= 0:
             return {}
 
-        seconds_per_year = 365 * 86400
+        # Load prices up front so the cache key sees the final price version
+        if not self._prices_fetched:
+            self.fetch_all_prices()
+
+        cache_key = (aura_pool.get('id'), tvl, bal_max_apr, self._price_version)
+        if cache_key in self._apr_cache:
+            return dict(self._apr_cache[cache_key])
+
         bal_apr = 0.0
         aura_apr = 0.0
         extra_apr = 0.0
@@ -458,7 +635,8 @@ class AuraFinanceAPI:
                 continue
 
             # Calculate APR: (rewardRate * 365 * 86400 * price) / tvl * 100
-            tokens_per_year = (reward_rate / (10 ** decimals)) * seconds_per_year
+            divisor = self._DECIMAL_DIVISORS.get(decimals) or 10.0 ** decimals
+            tokens_per_year = (reward_rate / divisor) * self.SECONDS_PER_YEAR
             apr = (tokens_per_year * token_price / tvl) * 100
 
             if token_symbol == 'BAL':
@@ -471,12 +649,15 @@ class AuraFinanceAPI:
         # Total Aura APY
         total_apr = bal_apr + aura_apr + extra_apr
 
-        return {
+        result = {
             'total_apr': total_apr,
             'bal_apr': bal_apr,
             'aura_apr': aura_apr,
             'extra_apr': extra_apr
         }
+        if cache_key[0]:
+            self._apr_cache[cache_key] = result
+        return dict(result)
 
     def get_aura_tvl(self, aura_pool: Dict, bpt_price: float = 1.0) -> float:
         """
@@ -549,34 +730,30 @@ class GoogleSheetsExporter:
         chain_title = chain.title()
         return f"{chain_title} {asset_type.upper()}"
 
-    def _format_pool_row(self, pool: PoolData) -> List:
-        """Format a pool as a row for the sheet"""
-        # Format other rewards
-        if pool.other_rewards:
-            other_str = sum(r['apy'] for r in pool.other_rewards)
-            other_formatted = f"{other_str:.2f}%"
-        else:
-            other_formatted = "0.00%"
-
-        # Format coins
-        coins_str = "/".join(pool.coins[:4])
-        if len(pool.coins) > 4:
+    @staticmethod
+    def _format_coins(coins: List[str]) -> str:
+        """Join up to 4 coin symbols for display"""
+        coins_str = "/".join(coins[:4])
+        if len(coins) > 4:
             coins_str += "..."
+        return coins_str
 
+    def _format_pool_row(self, pool: PoolData, timestamp: str) -> List:
+        """Format a pool as a row for the sheet, stamped with the export timestamp"""
         return [
             pool.name,
             pool.address,
-            coins_str,
+            self._format_coins(pool.coins),
             f"${pool.tvl:,.2f}",
             f"{pool.base_apy:.2f}%",
             f"{pool.bal_rewards_apy[0]:.2f}%" if pool.bal_rewards_apy else "0.00%",
             f"{pool.bal_rewards_apy[1]:.2f}%" if len(pool.bal_rewards_apy) > 1 else "0.00%",
-            other_formatted,
+            f"{pool.other_rewards_apy:.2f}%",
             f"{pool.total_apy:.2f}%",
             f"{pool.aura_apy:.2f}%" if pool.aura_apy is not None else "",
             f"${pool.aura_tvl:,.2f}" if pool.aura_tvl else "",
             pool.aura_staking_contract if pool.aura_staking_contract else "",
-            datetime.utcnow().strftime("%Y-%m-%d %H:%M")
+            timestamp
         ]
 
     def export(self, pools: List[PoolData], pools_config: List[Dict] = None) -> bool:
@@ -618,34 +795,54 @@ class GoogleSheetsExporter:
                 grouped[sheet_name] = []
             grouped[sheet_name].append(pool)
 
-        # Export each group to its sheet
-        for sheet_name, sheet_pools in grouped.items():
-            try:
-                # Get or create worksheet
-                try:
-                    worksheet = spreadsheet.worksheet(sheet_name)
-                except:
-                    worksheet = spreadsheet.add_worksheet(title=sheet_name, rows=100, cols=20)
-
-                # Clear existing data
-                worksheet.clear()
-
-                # Write headers
-                worksheet.update(values=[self.HEADERS], range_name='A1')
-
-                # Write data rows
-                rows = [self._format_pool_row(pool) for pool in sheet_pools]
-                if rows:
-                    worksheet.update(values=rows, range_name=f'A2:M{len(rows) + 1}')
+        # Batch every sheet into a fixed number of API calls: create missing
+        # sheets, clear all target sheets, then write headers + rows in one go
+        try:
+            existing = {ws.title for ws in spreadsheet.worksheets()}
+            new_sheets = [name for name in grouped if name not in existing]
+            if new_sheets:
+                spreadsheet.batch_update({'requests': [
+                    {'addSheet': {'properties': {
+                        'title': name,
+                        'gridProperties': {'rowCount': 100, 'columnCount': 20}
+                    }}}
+                    for name in new_sheets
+                ]})
+
+            spreadsheet.values_batch_clear(body={
+                'ranges': [self._sheet_range(name) for name in grouped]
+            })
+
+            # One timestamp for the whole export so every row agrees
+            timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M")
+
+            data = []
+            for sheet_name, sheet_pools in grouped.items():
+                rows = [self._format_pool_row(pool, timestamp) for pool in sheet_pools]
+                data.append({
+                    'range': self._sheet_range(sheet_name, 'A1'),
+                    'values': [self.HEADERS] + rows
+                })
 
-                print(f"Exported {len(sheet_pools)} pools to '{sheet_name}'")
+            spreadsheet.values_batch_update(body={
+                'valueInputOption': 'RAW',
+                'data': data
+            })
+        except Exception as e:
+            print(f"Failed to export to Google Sheets: {e}")
+            return False
 
-            except Exception as e:
-                print(f"Failed to export to '{sheet_name}': {e}")
-                continue
+        for sheet_name, sheet_pools in grouped.items():
+            print(f"Exported {len(sheet_pools)} pools to '{sheet_name}'")
 
         return True
 
+    @staticmethod
+    def _sheet_range(sheet_name: str, cells: str = None) -> str:
+        """Build an A1 range for a sheet, quoting the sheet name"""
+        quoted = "'" + sheet_name.replace("'", "''") + "'"
+        return f"{quoted}!{cells}" if cells else quoted
+
     def _cleanup_old_log_data(self, worksheet, days_to_keep: int = 30) -> int:
         """
         Remove log entries older than specified days.
@@ -665,15 +862,11 @@ class GoogleSheetsExporter:
             if len(all_values) <= 1:
                 return 0
 
-            headers = all_values[0]
-            data_rows = all_values[1:]
-
             cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
 
-            rows_to_keep = []
-            rows_deleted = 0
-
-            for row in data_rows:
+            # Sheet row numbers (1-based, header is row 1) of expired entries
+            stale_rows = []
+            for row_number, row in enumerate(all_values[1:], start=2):
                 if not row or len(row) < 2:
                     continue
 
@@ -683,19 +876,28 @@ class GoogleSheetsExporter:
                     timestamp_str = f"{date_str} {time_str}"
                     row_timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
 
-                    if row_timestamp >= cutoff_date:
-                        rows_to_keep.append(row)
-                    else:
-                        rows_deleted += 1
+                    if row_timestamp < cutoff_date:
+                        stale_rows.append(row_number)
                 except (ValueError, IndexError):
-                    rows_to_keep.append(row)
+                    continue
 
-            if rows_deleted > 0:
+            if not stale_rows:
+                return 0
+
+            rows_deleted = len(stale_rows)
+            first, last = stale_rows[0], stale_rows[-1]
+
+            if last - first + 1 == rows_deleted:
+                # Expired rows form one block (the usual case) - drop it in a single call
+                worksheet.delete_rows(first, last)
+            else:
+                stale = set(stale_rows)
+                rows_to_keep = [row for row_number, row in enumerate(all_values[1:], start=2)
+                                if row_number not in stale]
                 worksheet.clear()
-                new_data = [headers] + rows_to_keep
-                worksheet.update(values=new_data, range_name='A1')
-                print(f"Cleaned up {rows_deleted} old rows (keeping last {days_to_keep} days)")
+                worksheet.update(values=[all_values[0]] + rows_to_keep, range_name='A1')
 
+            print(f"Cleaned up {rows_deleted} old rows (keeping last {days_to_keep} days)")
             return rows_deleted
 
         except Exception as e:
@@ -760,23 +962,17 @@ class GoogleSheetsExporter:
 
         rows_to_append = []
         for pool in sorted_pools:
-            other_rewards_val = sum(r['apy'] for r in pool.other_rewards) if pool.other_rewards else 0
-
-            coins_str = "/".join(pool.coins[:4])
-            if len(pool.coins) > 4:
-                coins_str += "..."
-
             row = [
                 date_str,
                 time_str,
                 pool.name,
                 pool.chain.title(),
-                coins_str,
+                self._format_coins(pool.coins),
                 pool.tvl,
                 pool.base_apy,
                 pool.bal_rewards_apy[0] if pool.bal_rewards_apy else 0,
                 pool.bal_rewards_apy[1] if len(pool.bal_rewards_apy) > 1 else 0,
-                other_rewards_val,
+                pool.other_rewards_apy,
                 pool.total_apy,
                 pool.aura_apy if pool.aura_apy is not None else "",
                 pool.aura_tvl if pool.aura_tvl is not None else "",
@@ -787,7 +983,9 @@ class GoogleSheetsExporter:
 
         try:
             if rows_to_append:
-                worksheet.insert_rows(rows_to_append, row=2, value_input_option='USER_ENTERED')
+                # Append at the bottom (chronological order) - unlike inserting at
+                # row 2, this doesn't make Sheets shift every existing row down
+                worksheet.append_rows(rows_to_append, value_input_option='USER_ENTERED')
                 print(f"Logged {len(rows_to_append)} pool snapshots at {date_str} {time_str}")
             return True
         except Exception as e:
@@ -798,11 +996,40 @@ class GoogleSheetsExporter:
 class BalancerTracker:
     """Main tracker class - fetches data and saves to data store"""
 
-    def __init__(self, data_store: PoolDataStore = None, enable_aura: bool = False):
-        self.api = BalancerAPI()
+    # Max concurrent background fetches
+    MAX_WORKERS = 16
+
+    # Balancer APR item types that map to a fixed slot; anything else with a
+    # positive APR is reported as an other reward
+    _APR_SLOTS = {
+        'SWAP_FEE_24H': 'base',         # Swap fee APY
+        'VEBAL_EMISSIONS': 'bal_base',  # Base BAL rewards (min without boost)
+        'STAKING_BOOST': 'bal_boost',   # Additional BAL rewards with veBAL boost
+    }
+
+    def __init__(self, data_store: PoolDataStore = None, enable_aura: bool = False, use_cache: bool = True):
+        # One session shared by both clients so keep-alive connections are reused
+        self.session = create_session()
+        self.api = BalancerAPI(session=self.session)
         self.data_store = data_store or PoolDataStore()
         self.enable_aura = enable_aura
-        self.aura_api = AuraFinanceAPI() if enable_aura else None
+        self.cache = ResponseCache() if use_cache else None
+        self.aura_api = AuraFinanceAPI(session=self.session, cache=self.cache) if enable_aura else None
+
+    def _prefetch_aura(self, executor: ThreadPoolExecutor, chains: List[str]) -> List[Future]:
+        """
+        Start loading Aura pools and reward token prices in the background.
+
+        Returns:
+            Futures to wait on before parsing pools with Aura data
+        """
+        if not self.aura_api or not chains:
+            return []
+
+        return [
+            executor.submit(self.aura_api.prefetch_pools, chains),
+            executor.submit(self.aura_api.fetch_all_prices)
+        ]
 
     def _parse_pool(self, pool_data: Dict, chain: str, aura_enabled: bool = False) -> Optional[PoolData]:
         """Parse API response into PoolData object"""
@@ -816,36 +1043,31 @@ class BalancerTracker:
 
         # Parse APR items
         apr_items = dynamic.get('aprItems', [])
-        base_apy = 0.0
-        bal_base = 0.0  # VEBAL_EMISSIONS - base BAL rewards
-        bal_boost = 0.0  # STAKING_BOOST - additional boost with veBAL
+        slots = {'base': 0.0, 'bal_base': 0.0, 'bal_boost': 0.0}
         other_rewards = []
 
         for item in apr_items:
-            apr_type = item.get('type', '')
-            title = item.get('title', '')
             apr_value = float(item.get('apr', 0) or 0) * 100  # Convert to percentage
-            token_symbol = item.get('rewardTokenSymbol', '')
-
-            if apr_type == 'SWAP_FEE_24H':
-                base_apy = apr_value
-            elif apr_type == 'VEBAL_EMISSIONS':
-                # Base BAL rewards (min without boost)
-                bal_base = apr_value
-            elif apr_type == 'STAKING_BOOST':
-                # Additional BAL rewards with veBAL boost
-                bal_boost = apr_value
+            slot = self._APR_SLOTS.get(item.get('type', ''))
+
+            if slot:
+                slots[slot] = apr_value
             elif apr_value > 0:
                 other_rewards.append({
-                    'token': title,
+                    'token': item.get('title', ''),
                     'apy': apr_value
                 })
 
+        base_apy = slots['base']
+        bal_base = slots['bal_base']
+        bal_boost = slots['bal_boost']
+
         # BAL rewards: min = base, max = base + boost
         bal_rewards = [bal_base, bal_base + bal_boost]
 
         # Calculate total APY
-        total_apy = base_apy + bal_rewards[0] + sum(r['apy'] for r in other_rewards)
+        other_apy = sum(r['apy'] for r in other_rewards)
+        total_apy = base_apy + bal_rewards[0] + other_apy
 
         # Parse tokens
         coins = []
@@ -854,7 +1076,8 @@ class BalancerTracker:
         coin_prices = []
 
         for token in pool_data.get('poolTokens', []):
-            symbol = token.get('symbol', 'Unknown')
+            # Symbols repeat across pools - intern so they share one string
+            symbol = sys.intern(token.get('symbol', 'Unknown'))
             balance = float(token.get('balance', 0) or 0)
             weight = token.get('weight')
 
@@ -881,7 +1104,7 @@ class BalancerTracker:
 
         if self.aura_api and aura_enabled:
             pool_address = pool_data.get('address', '')
-            aura_pool = self.aura_api.find_pool_by_balancer_address(pool_address, chain)
+            aura_pool = self.aura_api.get_pools(chain).get(pool_address.lower())
 
             if aura_pool:
                 # Calculate Aura APR using max BAL boost
@@ -890,7 +1113,7 @@ class BalancerTracker:
 
                 if aura_apr_data:
                     # Total Aura APY = base + max BAL + AURA rewards + other
-                    aura_apy = base_apy + aura_apr_data.get('total_apr', 0) + sum(r['apy'] for r in other_rewards)
+                    aura_apy = base_apy + aura_apr_data.get('total_apr', 0) + other_apy
 
                 # Calculate Aura TVL
                 dynamic = pool_data.get('dynamicData', {})
@@ -906,7 +1129,7 @@ class BalancerTracker:
 
         return PoolData(
             name=pool_data.get('name', 'Unknown'),
-            chain=chain,
+            chain=sys.intern(chain),
             address=pool_data.get('address', ''),
             pool_id=pool_data.get('id', ''),
             tvl=tvl,
@@ -926,7 +1149,13 @@ class BalancerTracker:
 
     def get_pool(self, chain: str, identifier: str, aura_enabled: bool = False) -> Optional[PoolData]:
         """Get single pool data"""
-        pool_data = self.api.find_pool(identifier, chain)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Load Aura pools and prices while the Balancer lookup is in flight
+            aura_futures = self._prefetch_aura(executor, [chain] if aura_enabled else [])
+            pool_data = self.api.find_pool(identifier, chain)
+            for future in aura_futures:
+                future.result()
+
         return self._parse_pool(pool_data, chain, aura_enabled)
 
     def track_pools(self, pools_config: List[Dict]) -> List[PoolData]:
@@ -939,8 +1168,6 @@ class BalancerTracker:
         Returns:
             List of PoolData objects
         """
-        results = []
-
         # Group by chain for efficient batching
         by_chain = {}
         for cfg in pools_config:
@@ -949,38 +1176,67 @@ class BalancerTracker:
                 by_chain[chain] = []
             by_chain[chain].append(cfg)
 
-        for chain, pool_configs in by_chain.items():
-            print(f"Fetching {len(pool_configs)} pools from {chain}...")
+        # Aura pools and CoinGecko prices only depend on the config, so load them
+        # while the Balancer requests are in flight instead of after them
+        aura_chains = [chain for chain, cfgs in by_chain.items()
+                       if any(c.get('aura_enabled', False) for c in cfgs)]
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            aura_futures = self._prefetch_aura(executor, aura_chains)
 
-            # Collect addresses for batch query
-            addresses = [cfg['pool'] for cfg in pool_configs]
+            # 1. Fetch every Balancer pool concurrently - address batches per
+            # chain plus a single aliased request for all full pool IDs
+            address_futures = []
+            full_id_refs = []
 
-            # Check if any are full pool IDs vs addresses
-            full_ids = [a for a in addresses if len(a.replace('0x', '')) > 42]
-            short_addrs = [a for a in addresses if len(a.replace('0x', '')) <= 42]
+            for chain, pool_configs in by_chain.items():
+                print(f"Fetching {len(pool_configs)} pools from {chain}...")
 
-            # Batch fetch by address
-            if short_addrs:
-                pools = self.api.get_pools_by_address(short_addrs, chain)
-                for pool_data in pools:
-                    # Find matching config
-                    addr = pool_data.get('address', '').lower()
-                    cfg = next((c for c in pool_configs if c['pool'].lower() == addr), {})
-                    aura_enabled = cfg.get('aura_enabled', False)
+                # Collect addresses for batch query
+                addresses = [cfg['pool'] for cfg in pool_configs]
 
-                    parsed = self._parse_pool(pool_data, chain, aura_enabled)
-                    if parsed:
-                        results.append(parsed)
+                # Check if any are full pool IDs vs addresses
+                full_ids = [a for a in addresses if self.api.is_pool_id(a)]
+                short_addrs = [a for a in addresses if not self.api.is_pool_id(a)]
 
-            # Fetch full IDs individually
-            for pool_id in full_ids:
-                cfg = next((c for c in pool_configs if c['pool'] == pool_id), {})
-                aura_enabled = cfg.get('aura_enabled', False)
+                # Unique addresses in fixed-size batches, all in flight at once
+                short_addrs = list(dict.fromkeys(a.lower() for a in short_addrs))
+                batch_size = self.api.ADDRESS_BATCH_SIZE
+                for i in range(0, len(short_addrs), batch_size):
+                    batch = short_addrs[i:i + batch_size]
+                    future = executor.submit(self.api.get_pools_by_address, batch, chain)
+                    address_futures.append((chain, future))
 
-                pool_data = self.api.get_pool_by_id(pool_id, chain)
-                parsed = self._parse_pool(pool_data, chain, aura_enabled)
-                if parsed:
-                    results.append(parsed)
+                full_id_refs.extend((pool_id, chain) for pool_id in full_ids)
+
+            full_ids_future = executor.submit(self.api.get_pools_by_ids, full_id_refs)
+
+            # Key results by (chain, address or ID) to match them back to config
+            fetched = {}
+            for chain, future in address_futures:
+                for pool_data in future.result():
+                    fetched[(chain, pool_data.get('address', '').lower())] = pool_data
+
+            for (pool_id, chain), pool_data in zip(full_id_refs, full_ids_future.result()):
+                fetched[(chain, pool_id.lower())] = pool_data
+
+            # 2. Wait for the Aura data loaded in the background
+            for future in aura_futures:
+                future.result()
+
+        # 3. Parse in config order - Aura matching is a cached dict lookup per pool
+        results = []
+        seen = set()
+        for cfg in pools_config:
+            chain = cfg.get('chain', 'ethereum')
+            key = (chain, cfg['pool'].lower())
+            if key in seen:
+                continue
+            seen.add(key)
+
+            parsed = self._parse_pool(fetched.get(key), chain, cfg.get('aura_enabled', False))
+            if parsed:
+                results.append(parsed)
 
         return results
 
@@ -989,22 +1245,49 @@ class BalancerTracker:
         results = self.track_pools(pools_config)
 
         if results:
-            self.data_store.save(results)
-            self.data_store.append_history(results)
+            # One timestamp for the snapshot and its history entries; unchanged
+            # data is not saved again, so it doesn't add history either
+            timestamp = utc_now_iso()
+            if self.data_store.save(results, timestamp=timestamp):
+                self.data_store.append_history(results, timestamp=timestamp)
 
         return results
 
 
-def format_currency(amount: float) -> str:
-    """Format currency with appropriate suffixes"""
-    if amount >= 1_000_000_000:
-        return f"${amount/1_000_000_000:.2f}B"
-    elif amount >= 1_000_000:
-        return f"${amount/1_000_000:.2f}M"
-    elif amount >= 1_000:
-        return f"${amount/1_000:.2f}K"
-    else:
-        return f"${amount:.2f}"
+# Above this many rows print_results formats the table itself instead of using tabulate
+PLAIN_TABLE_ROWS = 200
+
+
+def _print_plain_table(headers: List[str], columns: List[List[str]]):
+    """Print a grid table like tabulate's, minus the rule between every row, in one write"""
+    widths = [max(len(h) + 2, max(map(len, col))) for h, col in zip(headers, columns)]
+    rule = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+
+    lines = [rule, "| " + " | ".join(h.ljust(w) for h, w in zip(headers, widths)) + " |", rule.replace("-", "=")]
+    lines.extend("| " + " | ".join(cell.ljust(w) for cell, w in zip(row, widths)) + " |"
+                 for row in zip(*columns))
+    lines.append(rule)
+
+    sys.stdout.write("\n" + "\n".join(lines) + "\n")
+
+
+def _format_bal_rewards(bal_rewards_apy: List[float]) -> str:
+    """Format a [min, max] BAL rewards range"""
+    if bal_rewards_apy and len(bal_rewards_apy) >= 2:
+        if bal_rewards_apy[0] == bal_rewards_apy[1]:
+            return f"{bal_rewards_apy[0]:.2f}%"
+        return f"{bal_rewards_apy[0]:.2f}-{bal_rewards_apy[1]:.2f}%"
+    return "0.00%"
+
+
+def _format_other_rewards(other_rewards: List[Dict]) -> str:
+    """Format the first two non-BAL rewards"""
+    if not other_rewards:
+        return "-"
+    other_str = ", ".join(f"{r['token']}: {r['apy']:.2f}%" for r in other_rewards[:2])
+    if len(other_rewards) > 2:
+        other_str += "..."
+    return other_str
 
 
 def print_results(pool_data_list: List[PoolData]):
@@ -1030,50 +1313,27 @@ def print_results(pool_data_list: List[PoolData]):
     if has_aura:
         headers.extend(["Aura APY", "Aura TVL"])
 
-    rows = []
-    for pool in pool_data_list:
-        # Format BAL rewards
-        if pool.bal_rewards_apy and len(pool.bal_rewards_apy) >= 2:
-            if pool.bal_rewards_apy[0] == pool.bal_rewards_apy[1]:
-                bal_str = f"{pool.bal_rewards_apy[0]:.2f}%"
-            else:
-                bal_str = f"{pool.bal_rewards_apy[0]:.2f}-{pool.bal_rewards_apy[1]:.2f}%"
-        else:
-            bal_str = "0.00%"
-
-        # Format other rewards
-        if pool.other_rewards:
-            rewards_list = [f"{r['token']}: {r['apy']:.2f}%" for r in pool.other_rewards[:2]]
-            other_str = ", ".join(rewards_list)
-            if len(pool.other_rewards) > 2:
-                other_str += "..."
-        else:
-            other_str = "-"
-
-        # Format coins
-        coins_str = "/".join(pool.coins[:3])
-        if len(pool.coins) > 3:
-            coins_str += "..."
-
-        row = [
-            pool.name[:35] + "..." if len(pool.name) > 35 else pool.name,
-            pool.chain.title(),
-            coins_str,
-            format_currency(pool.tvl),
-            f"{pool.base_apy:.2f}%",
-            bal_str,
-            other_str,
-            f"{pool.total_apy:.2f}%"
-        ]
-
-        if has_aura:
-            aura_apy_str = f"{pool.aura_apy:.2f}%" if pool.aura_apy is not None else "-"
-            aura_tvl_str = format_currency(pool.aura_tvl) if pool.aura_tvl else "-"
-            row.extend([aura_apy_str, aura_tvl_str])
+    # Build the table column by column - one comprehension per field
+    columns = [
+        [p.name[:35] + "..." if len(p.name) > 35 else p.name for p in pool_data_list],
+        [p.chain.title() for p in pool_data_list],
+        ["/".join(p.coins[:3]) + ("..." if len(p.coins) > 3 else "") for p in pool_data_list],
+        [format_currency(p.tvl) for p in pool_data_list],
+        [f"{p.base_apy:.2f}%" for p in pool_data_list],
+        [_format_bal_rewards(p.bal_rewards_apy) for p in pool_data_list],
+        [_format_other_rewards(p.other_rewards) for p in pool_data_list],
+        [f"{p.total_apy:.2f}%" for p in pool_data_list]
+    ]
 
-        rows.append(row)
+    if has_aura:
+        columns.append([f"{p.aura_apy:.2f}%" if p.aura_apy is not None else "-" for p in pool_data_list])
+        columns.append([format_currency(p.aura_tvl) if p.aura_tvl else "-" for p in pool_data_list])
 
-    print("\n" + tabulate(rows, headers=headers, tablefmt="grid"))
+    if len(pool_data_list) > PLAIN_TABLE_ROWS:
+        _print_plain_table(headers, columns)
+    else:
+        # Every cell is preformatted text, so skip tabulate's per-cell number parsing
+        print("\n" + tabulate(list(zip(*columns)), headers=headers, tablefmt="grid", disable_numparse=True))
     print(f"\nTotal pools: {len(pool_data_list)}")
 
 
@@ -1090,8 +1350,8 @@ def load_pools_config(filepath: str = None) -> tuple[List[Dict], bool]:
         return [], False
 
     try:
-        with open(filepath, 'r') as f:
-            config = json.load(f)
+        with open(filepath, 'rb') as f:
+            config = json_loads(f.read())
 
         if isinstance(config, dict):
             aura_enabled = config.get('settings', {}).get('aura_enabled', False)
@@ -1127,8 +1387,12 @@ def main():
     # Output control
     parser.add_argument('--no-json', action='store_true',
                        help='Disable saving to JSON (print only)')
+    parser.add_argument('--pretty-json', action='store_true',
+                       help='Indent the latest JSON file (default: compact)')
     parser.add_argument('--quiet', '-q', action='store_true',
                        help='Minimal output')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Bypass the on-disk cache for prices and Aura data')
 
     # Google Sheets export
     parser.add_argument('--export-sheets', action='store_true',
@@ -1141,13 +1405,14 @@ def main():
     args = parser.parse_args()
 
     # Initialize
-    data_store = PoolDataStore()
+    data_store = PoolDataStore(pretty=args.pretty_json)
 
     # Load config
     pools_config, config_aura_enabled = load_pools_config(args.pools)
     enable_aura = args.aura or config_aura_enabled
 
-    tracker = BalancerTracker(data_store=data_store, enable_aura=enable_aura)
+    tracker = BalancerTracker(data_store=data_store, enable_aura=enable_aura,
+                              use_cache=not args.no_cache)
 
     if enable_aura:
         print("Aura Finance integration enabled")
@@ -1178,8 +1443,9 @@ def main():
 
     # Save to JSON unless disabled
     if not args.no_json and results:
-        data_store.save(results)
-        data_store.append_history(results)
+        timestamp = utc_now_iso()
+        if data_store.save(results, timestamp=timestamp):
+            data_store.append_history(results, timestamp=timestamp)
 
     # Print results
     if not args.quiet:
@@ -3,14 +3,108 @@ Data Store for BalancerTracker
 JSON-based storage layer - the source of truth for pool data
 """
 
+import bisect
+import functools
+import hashlib
 import json
+import mmap
 import os
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Iterator, Optional
 from dataclasses import dataclass, field, asdict
 
+try:
+    import orjson
+except ImportError:  # Optional - fall back to the stdlib encoder
+    orjson = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:  # Optional - fall back to parsing the whole file
+    ijson = None
+
+# Decode errors raised while reading data files
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+# Reused stdlib encoders - json.dumps() builds a new encoder per call for non-default options
+_INDENT_ENCODER = json.JSONEncoder(indent=2)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as JSON bytes, optionally indented (orjson when available)"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return _INDENT_ENCODER.encode(obj).encode()
+    return _COMPACT_ENCODER.encode(obj).encode()
+
+
+def utc_now_iso() -> str:
+    """Current UTC time in the store's timestamp format (e.g. 2025-12-13T08:56:36Z)"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode JSON bytes (orjson when available)"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_KEY_RE = re.compile(r'[^a-z0-9]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def _slugify(name: str) -> str:
+    """Lowercase name with runs of non-alphanumerics collapsed to '_'"""
+    return _KEY_RE.sub('_', name.lower()).strip('_')
+
+
+def format_currency(amount: float) -> str:
+    """Format currency with appropriate suffixes"""
+    if amount >= 1_000_000_000:
+        return f"${amount/1_000_000_000:.2f}B"
+    elif amount >= 1_000_000:
+        return f"${amount/1_000_000:.2f}M"
+    elif amount >= 1_000:
+        return f"${amount/1_000:.2f}K"
+    else:
+        return f"${amount:.2f}"
+
+
+def _object_end(buf, start: int) -> int:
+    """Index just past the JSON object opening at buf[start] (string-aware brace matching)"""
+    quote, backslash, open_brace, close_brace = b'"\\{}'
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(buf)):
+        c = buf[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == backslash:
+                escaped = True
+            elif c == quote:
+                in_string = False
+        elif c == quote:
+            in_string = True
+        elif c == open_brace:
+            depth += 1
+        elif c == close_brace:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    raise ValueError("Unterminated JSON object")
+
+
+# Value slot placeholder in a pre-encoded JSON envelope
+_SLOT_RE = re.compile(rb'"\$(\d+)"')
+
+
+@dataclass(slots=True)
 class PoolData:
     """Data structure for Balancer pool information"""
     name: str
@@ -32,6 +126,11 @@ class PoolData:
     aura_boost: Optional[float] = None
     aura_staking_contract: Optional[str] = None
 
+    @property
+    def other_rewards_apy(self) -> float:
+        """Combined APY of all other (non-BAL) rewards"""
+        return sum(r['apy'] for r in self.other_rewards)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return asdict(self)
@@ -49,58 +148,86 @@ class PoolDataStore:
     This is the source of truth - all pool data flows through here.
     """
 
-    def __init__(self, data_dir: str = "data"):
+    # Separator before each item and closing bracket of the "pools" array, keyed by indent
+    _POOLS_ARRAY = {
+        True: (b"\n    ", b"\n  ]"),
+        False: (b"", b"]")
+    }
+
+    def __init__(self, data_dir: str = "data", pretty: bool = False):
         """
         Initialize the data store.
 
         Args:
             data_dir: Directory for JSON files (default: "data")
+            pretty: Indent the latest file (default: compact)
         """
         self.data_dir = data_dir
+        self.pretty = pretty
         os.makedirs(data_dir, exist_ok=True)
 
         # File paths
         self.latest_file = os.path.join(data_dir, "balancer_pools_latest.json")
+        # Hash of the pools last written to latest_file, to skip unchanged saves
+        self.latest_hash_file = os.path.join(data_dir, ".latest.sha256")
+        # Append-only history log: one JSON snapshot per line
+        self.history_jsonl = os.path.join(data_dir, "balancer_pools_history.jsonl")
+        # Sidecar index: pool key -> [[timestamp, byte offset, length], ...] into history_jsonl
+        self.history_index = os.path.join(data_dir, "history.index.json")
+        # Legacy nested history file, migrated into history_jsonl on first use
         self.history_file = os.path.join(data_dir, "balancer_pools_history.json")
 
-    def save(self, pool_data_list: List[PoolData]) -> str:
+    def save(self, pool_data_list: List[PoolData], timestamp: str = None) -> str:
         """
         Save current pool data snapshot.
 
         Args:
             pool_data_list: List of PoolData objects
+            timestamp: Snapshot time from utc_now_iso(), or None for now
 
         Returns:
-            Path to saved file
+            Path to saved file, or "" if nothing was saved (no data, or
+            the pools are unchanged since the last save)
         """
         if not pool_data_list:
             print("No pool data to save")
             return ""
 
-        timestamp = datetime.utcnow()
+        pools_json = self._encode_pools(pool_data_list, self.pretty)
 
-        data = {
-            "version": "1.0",
-            "metadata": {
-                "generated_at": timestamp.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "source": "BalancerTracker",
-                "total_pools": len(pool_data_list),
-                "chains": sorted(set(p.chain for p in pool_data_list)),
-                "has_aura": any(p.aura_apy is not None for p in pool_data_list)
-            },
-            "pools": [self._pool_to_json(p) for p in pool_data_list]
+        # generated_at changes every run, so compare only the pools
+        digest = hashlib.sha256(pools_json).hexdigest()
+        if digest == self._read_latest_hash() and os.path.exists(self.latest_file):
+            print(f"Pool data unchanged since last save, {self.latest_file} not rewritten")
+            return ""
+
+        metadata = {
+            "generated_at": timestamp or utc_now_iso(),
+            "source": "BalancerTracker",
+            "total_pools": len(pool_data_list),
+            "chains": sorted(set(p.chain for p in pool_data_list)),
+            "has_aura": any(p.aura_apy is not None for p in pool_data_list)
         }
 
-        with open(self.latest_file, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(self.latest_file, "wb") as f:
+            f.write(self._encode_snapshot(metadata, pools_json, indent=self.pretty))
+        with open(self.latest_hash_file, "w") as f:
+            f.write(digest)
 
         print(f"Saved {len(pool_data_list)} pools to {self.latest_file}")
         return self.latest_file
 
-    def load(self) -> List[PoolData]:
+    def load(self, filter_chains: List[str] = None, limit: int = None) -> List[PoolData]:
         """
         Load latest pool data from JSON.
 
+        Pools are streamed from the file when ijson is installed, so memory
+        stays flat and reading stops as soon as limit pools are collected.
+
+        Args:
+            filter_chains: Only load pools on these chains, or None for all
+            limit: Stop after this many pools, or None for all
+
         Returns:
             List of PoolData objects
         """
@@ -108,30 +235,42 @@ class PoolDataStore:
             print(f"No data file found at {self.latest_file}")
             return []
 
-        try:
-            with open(self.latest_file, "r") as f:
-                data = json.load(f)
+        chains = set(filter_chains) if filter_chains else None
 
+        try:
             pools = []
-            for pool_json in data.get("pools", []):
-                pool = self._json_to_pool(pool_json)
-                if pool:
-                    pools.append(pool)
+            with open(self.latest_file, "rb") as f:
+                for pool_json in self._iter_pool_json(f):
+                    if chains and pool_json.get("chain", "ethereum") not in chains:
+                        continue
+                    pool = self._json_to_pool(pool_json)
+                    if pool:
+                        pools.append(pool)
+                        if limit and len(pools) >= limit:
+                            break
 
             print(f"Loaded {len(pools)} pools from {self.latest_file}")
             return pools
 
-        except json.JSONDecodeError as e:
+        except _JSON_ERRORS as e:
             print(f"Error reading JSON: {e}")
             return []
 
-    def append_history(self, pool_data_list: List[PoolData], max_snapshots: int = None) -> str:
+    def append_history(self, pool_data_list: List[PoolData], max_snapshots: int = None,
+                       timestamp: str = None) -> str:
         """
-        Append current data to history file for time-series tracking.
+        Append current data to history log for time-series tracking.
+
+        Each pool snapshot is written as one JSON line, so appending never
+        reads or rewrites existing log lines. The offset index, however, is
+        loaded and rewritten in full on every append, so each call costs
+        O(total snapshots) in index I/O. Pool metadata is only written
+        when a pool first appears or its metadata changes.
 
         Args:
             pool_data_list: List of PoolData objects
             max_snapshots: Optional limit on snapshots per pool
+            timestamp: Snapshot time from utc_now_iso(), or None for now
 
         Returns:
             Path to history file
@@ -139,68 +278,112 @@ class PoolDataStore:
         if not pool_data_list:
             return ""
 
-        timestamp = datetime.utcnow()
-        timestamp_str = timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._migrate_legacy_history()
 
-        # Load existing history or create new
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, "r") as f:
-                    history = json.load(f)
-            except json.JSONDecodeError:
-                history = self._empty_history()
-        else:
-            history = self._empty_history()
+        timestamp_str = timestamp or utc_now_iso()
 
-        # Update timestamp
-        history["last_updated"] = timestamp_str
+        index = self._current_history_index()
+        known_metadata = index["metadata"]
 
-        # Append snapshot for each pool
+        # Terminate a cut-off last line so the first new snapshot starts on its own line
+        lines = bytearray(b"\n" if self._log_needs_newline() else b"")
+        entries = []  # (pool_key, timestamp, offset within lines, length)
         for pool in pool_data_list:
             pool_key = self._generate_pool_key(pool)
-
-            if pool_key not in history["pools"]:
-                history["pools"][pool_key] = {
-                    "metadata": {
-                        "name": pool.name,
-                        "chain": pool.chain,
-                        "address": pool.address,
-                        "pool_id": pool.pool_id
-                    },
-                    "snapshots": []
-                }
-
-            snapshot = {
-                "timestamp": timestamp_str,
-                "tvl": round(pool.tvl, 2),
-                "base_apy": round(pool.base_apy, 4),
-                "bal_rewards_min": round(pool.bal_rewards_apy[0], 4) if pool.bal_rewards_apy else 0,
-                "bal_rewards_max": round(pool.bal_rewards_apy[1], 4) if len(pool.bal_rewards_apy) > 1 else 0,
-                "total_apy": round(pool.total_apy, 4)
+            metadata = {
+                "name": pool.name,
+                "chain": pool.chain,
+                "address": pool.address,
+                "pool_id": pool.pool_id
             }
+            record = {"pool_key": pool_key}
+            if known_metadata.get(pool_key) != metadata:
+                record["metadata"] = known_metadata[pool_key] = metadata
+            record.update(self._snapshot(pool, timestamp_str))
+
+            line = json_dumps(record) + b"\n"
+            entries.append((pool_key, timestamp_str, len(lines), len(line)))
+            lines += line
+
+        with open(self.history_jsonl, "ab") as f:
+            start = f.tell()
+            f.write(lines)
 
-            # Add Aura data if present
-            if pool.aura_apy is not None:
-                snapshot["aura_apy"] = round(pool.aura_apy, 4)
-            if pool.aura_tvl is not None:
-                snapshot["aura_tvl"] = round(pool.aura_tvl, 2)
+        self._update_history_index(index, start, len(lines), entries)
 
-            history["pools"][pool_key]["snapshots"].append(snapshot)
+        # Trim old snapshots if limit set
+        if max_snapshots:
+            self.compact_history(max_snapshots)
 
-            # Trim old snapshots if limit set
-            if max_snapshots:
-                snapshots = history["pools"][pool_key]["snapshots"]
-                if len(snapshots) > max_snapshots:
-                    history["pools"][pool_key]["snapshots"] = snapshots[-max_snapshots:]
+        print(f"History updated: {len(pool_data_list)} pool snapshots appended to {self.history_jsonl}")
 
-        # Save updated history
-        with open(self.history_file, "w") as f:
-            json.dump(history, f, indent=2)
+        return self.history_jsonl
+
+    def _log_needs_newline(self) -> bool:
+        """True if the history log is non-empty and doesn't end with a newline"""
+        try:
+            with open(self.history_jsonl, "rb") as f:
+                if f.seek(0, os.SEEK_END) == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except OSError:
+            return False
+
+    def compact_history(self, max_snapshots: int) -> int:
+        """
+        Rewrite the history log keeping only the newest snapshots per pool.
 
-        total_snapshots = sum(len(p["snapshots"]) for p in history["pools"].values())
-        print(f"History updated: {len(pool_data_list)} pools, {total_snapshots} total snapshots")
+        Args:
+            max_snapshots: Snapshots to keep per pool
 
-        return self.history_file
+        Returns:
+            Number of lines removed
+        """
+        if not os.path.exists(self.history_jsonl):
+            return 0
+
+        # First pass: pool key of every line and snapshot count per pool
+        line_keys = []
+        counts = {}
+        with open(self.history_jsonl, "rb") as f:
+            for line in f:
+                try:
+                    key = json_loads(line).get("pool_key")
+                except json.JSONDecodeError:
+                    key = None
+                line_keys.append(key)
+                if key:
+                    counts[key] = counts.get(key, 0) + 1
+
+        if None not in line_keys and all(c <= max_snapshots for c in counts.values()):
+            return 0
+
+        # Second pass: copy the last max_snapshots lines of each pool
+        seen = {}
+        pending_metadata = {}  # From dropped lines, moved onto the pool's first kept line
+        removed = 0
+        tmp_file = f"{self.history_jsonl}.tmp"
+        with open(self.history_jsonl, "rb") as src, open(tmp_file, "wb") as dst:
+            for line, key in zip(src, line_keys):
+                if key:
+                    seen[key] = seen.get(key, 0) + 1
+                    if counts[key] - seen[key] < max_snapshots:
+                        if key in pending_metadata:
+                            record = json_loads(line)
+                            metadata = pending_metadata.pop(key)
+                            if "metadata" not in record:
+                                line = json_dumps({"pool_key": key, "metadata": metadata, **record}) + b"\n"
+                        dst.write(line)
+                        continue
+                    metadata = json_loads(line).get("metadata")
+                    if metadata:
+                        pending_metadata[key] = metadata
+                removed += 1
+        os.replace(tmp_file, self.history_jsonl)
+        self._write_history_index(self._build_history_index())
+
+        return removed
 
     def get_history(self, pool_key: str = None, days: int = None) -> Dict[str, Any]:
         """
@@ -213,37 +396,221 @@ class PoolDataStore:
         Returns:
             History data dictionary
         """
-        if not os.path.exists(self.history_file):
-            return {}
+        self._migrate_legacy_history()
 
-        try:
-            with open(self.history_file, "r") as f:
-                history = json.load(f)
+        if not os.path.exists(self.history_jsonl):
+            return {}
 
-            if pool_key:
-                pool_history = history.get("pools", {}).get(pool_key, {})
-                if days:
-                    pool_history = self._filter_by_days(pool_history, days)
+        if pool_key:
+            # Seek straight to this pool's lines when the index is current
+            pool_history = self._read_indexed_history(pool_key, days)
+            if pool_history is not None:
                 return pool_history
 
+        history = self._read_history(pool_key)
+
+        if pool_key:
+            pool_history = history["pools"].get(pool_key, {})
             if days:
-                # Filter all pools by days
-                filtered = {"pools": {}}
-                for key, pool_data in history.get("pools", {}).items():
-                    filtered["pools"][key] = self._filter_by_days(pool_data, days)
-                return filtered
+                pool_history = self._filter_by_days(pool_history, days)
+            return pool_history
+
+        if days:
+            # Filter all pools by days
+            filtered = {"pools": {}}
+            for key, pool_data in history["pools"].items():
+                filtered["pools"][key] = self._filter_by_days(pool_data, days)
+            return filtered
+
+        return history
+
+    def _read_history(self, pool_key: str = None) -> Dict[str, Any]:
+        """Build the nested {"pools": {key: {"metadata", "snapshots"}}} view from the log"""
+        history = self._empty_history()
+        pools = history["pools"]
+        last_updated = None
+
+        with open(self.history_jsonl, "rb") as f:
+            for line in f:
+                try:
+                    record = json_loads(line)
+                except json.JSONDecodeError:
+                    continue  # Skip a torn or blank line
+
+                key = record.pop("pool_key", None)
+                if not key or (pool_key and key != pool_key):
+                    continue
+
+                metadata = record.pop("metadata", None)
+                entry = pools.get(key)
+                if entry is None:
+                    entry = pools[key] = {"metadata": metadata or {}, "snapshots": []}
+                elif metadata:
+                    entry["metadata"] = metadata
+                entry["snapshots"].append(record)
+
+                timestamp = record.get("timestamp")
+                if timestamp and (last_updated is None or timestamp > last_updated):
+                    last_updated = timestamp
+
+        # Chronological like the index (already sorted unless timestamp= went backwards)
+        for entry in pools.values():
+            entry["snapshots"].sort(key=lambda snap: snap.get("timestamp", ""))
+
+        if last_updated:
+            history["last_updated"] = last_updated
+        return history
+
+    def _read_indexed_history(self, pool_key: str, days: int = None) -> Optional[Dict[str, Any]]:
+        """
+        Read one pool's history via the offset index.
 
-            return history
+        Returns None when the index is missing or stale, so the caller
+        falls back to a full scan of the log.
+        """
+        index = self._load_history_index()
+        if index is None:
+            return None
 
-        except json.JSONDecodeError:
+        entries = index["pools"].get(pool_key)
+        if not entries:
             return {}
+        metadata = index["metadata"].get(pool_key, {})
+
+        start = 0
+        if days:
+            # ISO timestamps are zero-padded, so string order is time order
+            start = bisect.bisect_left(entries, self._days_cutoff(days), key=lambda e: e[0])
+
+        snapshots = []
+        with open(self.history_jsonl, "rb") as f:
+            for _, offset, length in entries[start:]:
+                f.seek(offset)
+                record = json_loads(f.read(length))
+                record.pop("pool_key", None)
+                record.pop("metadata", None)
+                snapshots.append(record)
+
+        return {"metadata": metadata, "snapshots": snapshots}
+
+    def _load_history_index(self) -> Optional[Dict[str, Any]]:
+        """Load the offset index, or None if it is missing or out of date with the log"""
+        try:
+            with open(self.history_index, "rb") as f:
+                index = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if "metadata" not in index or index.get("size") != os.path.getsize(self.history_jsonl):
+            return None
+        return index
+
+    def _current_history_index(self) -> Dict[str, Any]:
+        """Load the offset index, rebuilding it from the log if it is stale"""
+        if not os.path.exists(self.history_jsonl):
+            return {"size": 0, "pools": {}, "metadata": {}}
+        return self._load_history_index() or self._build_history_index()
+
+    def _update_history_index(self, index: Dict[str, Any], start: int, length: int,
+                              entries: List[tuple]):
+        """Add freshly appended lines to the index (rewritten whole), rebuilding it if the log moved underneath"""
+        if index["size"] != start:
+            index = self._build_history_index()
+        else:
+            pools = index["pools"]
+            for pool_key, timestamp, offset, line_length in entries:
+                # Keep each list in timestamp order for bisect, even if timestamp= went backwards
+                bisect.insort(pools.setdefault(pool_key, []), [timestamp, start + offset, line_length],
+                              key=lambda e: e[0])
+            index["size"] = start + length
+
+        self._write_history_index(index)
+
+    def _build_history_index(self) -> Dict[str, Any]:
+        """Scan the whole log and index every line by pool key"""
+        pools = {}
+        metadata = {}  # Latest metadata per pool key
+        offset = 0
+        with open(self.history_jsonl, "rb") as f:
+            for line in f:
+                try:
+                    record = json_loads(line)
+                    key = record["pool_key"]
+                    pools.setdefault(key, []).append(
+                        [record.get("timestamp", ""), offset, len(line)]
+                    )
+                    if record.get("metadata"):
+                        metadata[key] = record["metadata"]
+                except (ValueError, KeyError, TypeError):
+                    pass  # Torn or blank line - not indexed
+                offset += len(line)
+
+        for entries in pools.values():
+            entries.sort(key=lambda e: e[0])
+
+        return {"size": offset, "pools": pools, "metadata": metadata}
+
+    def _write_history_index(self, index: Dict[str, Any]):
+        """Atomically replace the index file"""
+        tmp_file = f"{self.history_index}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(json_dumps(index))
+        os.replace(tmp_file, self.history_index)
+
+    def _migrate_legacy_history(self):
+        """Convert the old nested history JSON into the JSON Lines log, once"""
+        if os.path.exists(self.history_jsonl) or not os.path.exists(self.history_file):
+            return
+
+        try:
+            with open(self.history_file, "rb") as f:
+                legacy = json_loads(f.read())
+        except json.JSONDecodeError:
+            return
+
+        lines = bytearray()
+        for key, pool_history in legacy.get("pools", {}).items():
+            metadata = pool_history.get("metadata", {})
+            for i, snapshot in enumerate(pool_history.get("snapshots", [])):
+                # Metadata only needs to appear on a pool's first line
+                record = {"pool_key": key, "metadata": metadata} if i == 0 else {"pool_key": key}
+                lines += json_dumps({**record, **snapshot})
+                lines += b"\n"
+
+        tmp_file = f"{self.history_jsonl}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(lines)
+        os.replace(tmp_file, self.history_jsonl)
+        self._write_history_index(self._build_history_index())
+
+        print(f"Migrated history from {self.history_file} to {self.history_jsonl}")
+
+    def _snapshot(self, pool: PoolData, timestamp_str: str) -> Dict[str, Any]:
+        """Build a history snapshot for a pool"""
+        snapshot = {
+            "timestamp": timestamp_str,
+            "tvl": round(pool.tvl, 2),
+            "base_apy": round(pool.base_apy, 4),
+            "bal_rewards_min": round(pool.bal_rewards_apy[0], 4) if pool.bal_rewards_apy else 0,
+            "bal_rewards_max": round(pool.bal_rewards_apy[1], 4) if len(pool.bal_rewards_apy) > 1 else 0,
+            "total_apy": round(pool.total_apy, 4)
+        }
 
-    def save_archive(self, pool_data_list: List[PoolData]) -> str:
+        # Add Aura data if present
+        if pool.aura_apy is not None:
+            snapshot["aura_apy"] = round(pool.aura_apy, 4)
+        if pool.aura_tvl is not None:
+            snapshot["aura_tvl"] = round(pool.aura_tvl, 2)
+
+        return snapshot
+
+    def save_archive(self, pool_data_list: List[PoolData], timestamp: str = None) -> str:
         """
         Save dated archive file.
 
         Args:
             pool_data_list: List of PoolData objects
+            timestamp: Snapshot time from utc_now_iso(), or None for now
 
         Returns:
             Path to archive file
@@ -251,24 +618,20 @@ class PoolDataStore:
         if not pool_data_list:
             return ""
 
-        date_str = datetime.utcnow().strftime("%Y%m%d")
+        timestamp = timestamp or utc_now_iso()
+        date_str = timestamp[:10].replace("-", "")
         archive_file = os.path.join(self.data_dir, f"balancer_pools_{date_str}.json")
 
-        timestamp = datetime.utcnow()
-
-        data = {
-            "version": "1.0",
-            "metadata": {
-                "generated_at": timestamp.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "source": "BalancerTracker",
-                "total_pools": len(pool_data_list),
-                "chains": sorted(set(p.chain for p in pool_data_list))
-            },
-            "pools": [self._pool_to_json(p) for p in pool_data_list]
+        metadata = {
+            "generated_at": timestamp,
+            "source": "BalancerTracker",
+            "total_pools": len(pool_data_list),
+            "chains": sorted(set(p.chain for p in pool_data_list))
         }
 
-        with open(archive_file, "w") as f:
-            json.dump(data, f, indent=2)
+        # Archives are kept for people to browse, so always indent them
+        with open(archive_file, "wb") as f:
+            f.write(self._encode_snapshot(metadata, self._encode_pools(pool_data_list, True), indent=True))
 
         print(f"Archive saved to {archive_file}")
         return archive_file
@@ -279,14 +642,29 @@ class PoolDataStore:
             return {}
 
         try:
-            with open(self.latest_file, "r") as f:
-                data = json.load(f)
-            return data.get("metadata", {})
-        except json.JSONDecodeError:
+            with open(self.latest_file, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # metadata is written before pools, so only the file header is touched
+                key = mm.find(b'"metadata"')
+                start = mm.find(b"{", key) if key != -1 else -1
+                if start == -1 or mm[key + len(b'"metadata"'):start].strip() != b":":
+                    return {}
+                return json_loads(mm[start:_object_end(mm, start)])
+        except (OSError, ValueError):  # Includes empty files and decode errors
             return {}
 
+    def _iter_pool_json(self, f) -> Iterator[Dict[str, Any]]:
+        """Yield raw pool dicts from an open latest/archive file"""
+        if ijson:
+            yield from ijson.items(f, "pools.item", use_float=True)
+        else:
+            yield from json_loads(f.read()).get("pools", [])
+
     def _pool_to_json(self, pool: PoolData) -> Dict[str, Any]:
         """Convert PoolData to JSON-serializable dict with structure"""
+        bal_rewards = pool.bal_rewards_apy
+        aura_apy = round(pool.aura_apy, 4) if pool.aura_apy is not None else None
+
         result = {
             "id": self._generate_pool_key(pool),
             "name": pool.name,
@@ -295,11 +673,11 @@ class PoolDataStore:
             "pool_id": pool.pool_id,
             "data": {
                 "tvl": round(pool.tvl, 2),
-                "tvl_formatted": self._format_currency(pool.tvl),
+                "tvl_formatted": format_currency(pool.tvl),
                 "base_apy": round(pool.base_apy, 4),
                 "bal_rewards": {
-                    "min": round(pool.bal_rewards_apy[0], 4) if pool.bal_rewards_apy else 0,
-                    "max": round(pool.bal_rewards_apy[1], 4) if len(pool.bal_rewards_apy) > 1 else 0
+                    "min": round(bal_rewards[0], 4) if bal_rewards else 0,
+                    "max": round(bal_rewards[1], 4) if len(bal_rewards) > 1 else 0
                 },
                 "other_rewards": pool.other_rewards,
                 "total_apy": round(pool.total_apy, 4)
@@ -311,16 +689,57 @@ class PoolDataStore:
                 "prices": [round(p, 4) for p in pool.coin_prices]
             },
             # Flat aura_apy field for FarmTracker compatibility
-            "aura_apy": round(pool.aura_apy, 4) if pool.aura_apy is not None else None,
+            "aura_apy": aura_apy,
             "aura": {
-                "apy": round(pool.aura_apy, 4) if pool.aura_apy is not None else None,
+                "apy": aura_apy,
                 "tvl": round(pool.aura_tvl, 2) if pool.aura_tvl is not None else None,
                 "boost": round(pool.aura_boost, 2) if pool.aura_boost is not None else None,
                 "staking_contract": pool.aura_staking_contract
-            } if pool.aura_apy is not None else None
+            } if aura_apy is not None else None
         }
         return result
 
+    def _encode_snapshot(self, metadata: Dict[str, Any], pools_json: bytes,
+                         indent: bool = True) -> bytearray:
+        """
+        Encode a latest/archive snapshot document.
+
+        The envelope is encoded once with a placeholder in the "pools" slot,
+        and the pools array from _encode_pools() is dropped in between.
+        """
+        envelope = {"version": "1.0", "metadata": metadata, "pools": "$0"}
+        head, _, tail = _SLOT_RE.split(json_dumps(envelope, indent))
+
+        buf = bytearray(head)
+        buf += pools_json
+        buf += tail
+        return buf
+
+    def _encode_pools(self, pool_data_list: List[PoolData], indent: bool = True) -> bytearray:
+        """Encode the "pools" array, streaming each pool into one buffer"""
+        item_sep, close = self._POOLS_ARRAY[indent]
+
+        buf = bytearray(b"[")
+        for i, pool in enumerate(pool_data_list):
+            buf += item_sep if i == 0 else b"," + item_sep
+            self._write_pool_json(buf, pool, indent)
+        buf += close
+        return buf
+
+    def _read_latest_hash(self) -> str:
+        """Hash stored by the last save, or "" if there is none"""
+        try:
+            with open(self.latest_hash_file) as f:
+                return f.read().strip()
+        except OSError:
+            return ""
+
+    def _write_pool_json(self, buf: bytearray, pool: PoolData, indent: bool = True):
+        """Append a pool's JSON to buf as an item of the top-level "pools" array"""
+        encoded = json_dumps(self._pool_to_json(pool), indent)
+        # Items sit two levels deep (root object -> "pools" array)
+        buf += encoded.replace(b"\n", b"\n    ") if indent else encoded
+
     def _json_to_pool(self, data: Dict[str, Any]) -> Optional[PoolData]:
         """Convert JSON dict back to PoolData"""
         try:
@@ -330,9 +749,10 @@ class PoolDataStore:
 
             bal_rewards = pool_data.get("bal_rewards", {})
 
+            # Chains and token symbols repeat across pools and snapshots - share one object each
             return PoolData(
                 name=data.get("name", "Unknown"),
-                chain=data.get("chain", "ethereum"),
+                chain=sys.intern(data.get("chain", "ethereum")),
                 address=data.get("address", ""),
                 pool_id=data.get("pool_id", ""),
                 tvl=pool_data.get("tvl", 0),
@@ -340,7 +760,7 @@ class PoolDataStore:
                 bal_rewards_apy=[bal_rewards.get("min", 0), bal_rewards.get("max", 0)],
                 other_rewards=pool_data.get("other_rewards", []),
                 total_apy=pool_data.get("total_apy", 0),
-                coins=tokens.get("coins", []),
+                coins=[sys.intern(c) for c in tokens.get("coins", [])],
                 coin_ratios=tokens.get("ratios", []),
                 coin_amounts=tokens.get("amounts", []),
                 coin_prices=tokens.get("prices", []),
@@ -355,47 +775,32 @@ class PoolDataStore:
 
     def _generate_pool_key(self, pool: PoolData) -> str:
         """Generate unique key for a pool"""
-        import re
-        name = pool.name.lower()
-        name = re.sub(r'[^a-z0-9]+', '_', name).strip('_')
-        return f"{pool.chain}_{name}"
-
-    def _format_currency(self, amount: float) -> str:
-        """Format currency with suffixes"""
-        if amount >= 1_000_000_000:
-            return f"${amount/1_000_000_000:.2f}B"
-        elif amount >= 1_000_000:
-            return f"${amount/1_000_000:.2f}M"
-        elif amount >= 1_000:
-            return f"${amount/1_000:.2f}K"
-        else:
-            return f"${amount:.2f}"
+        return f"{pool.chain}_{_slugify(pool.name)}"
 
     def _empty_history(self) -> Dict[str, Any]:
         """Create empty history structure"""
         return {
             "version": "1.0",
-            "last_updated": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "last_updated": utc_now_iso(),
             "pools": {}
         }
 
+    def _days_cutoff(self, days: int) -> str:
+        """Timestamp string for N days ago, in the store's timestamp format"""
+        return (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
     def _filter_by_days(self, pool_data: Dict, days: int) -> Dict:
         """Filter snapshots to last N days"""
-        from datetime import timedelta
-
-        cutoff = datetime.utcnow() - timedelta(days=days)
-
         if "snapshots" not in pool_data:
             return pool_data
 
-        filtered_snapshots = []
-        for snapshot in pool_data.get("snapshots", []):
-            try:
-                ts = datetime.strptime(snapshot["timestamp"], "%Y-%m-%dT%H:%M:%SZ")
-                if ts >= cutoff:
-                    filtered_snapshots.append(snapshot)
-            except (KeyError, ValueError):
-                continue
+        # Zero-padded ISO timestamps compare correctly as strings, no parsing
+        # needed; the length check drops malformed timestamps as before
+        cutoff = self._days_cutoff(days)
+        filtered_snapshots = [
+            s for s in pool_data["snapshots"]
+            if (ts := s.get("timestamp", "")) >= cutoff and len(ts) == len(cutoff)
+        ]
 
         return {
             **pool_data,